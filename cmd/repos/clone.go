@@ -1,7 +1,6 @@
 package main
 
 import (
-	"bufio"
 	"errors"
 	"flag"
 	"fmt"
@@ -14,7 +13,7 @@ import (
 	"github.com/MiguelRodo/repos/v2/internal/sysutil"
 )
 
-var hasNonLocalRemotesInFileFunc = hasNonLocalRemotesInFile
+var hasNonLocalRemotesFunc = hasNonLocalRemotes
 var checkNonInteractiveAuthForCloneFunc = checkNonInteractiveAuthForClone
 
 func runClone(args []string) error {
@@ -125,14 +124,14 @@ func runClone(args []string) error {
 	if err := st.applyGlobalFlagsFromFile(); err != nil {
 		return err
 	}
-	if err := sysutil.CheckClonePrerequisites(st.reposFile); err != nil {
+	lines, err := st.listLines()
+	if err != nil {
 		return err
 	}
-	hasNonLocal, err := hasNonLocalRemotesInFileFunc(st.reposFile)
-	if err != nil {
+	if err := sysutil.CheckClonePrerequisites(lines); err != nil {
 		return err
 	}
-	if hasNonLocal {
+	if hasNonLocalRemotesFunc(lines) {
 		if err := checkNonInteractiveAuthForCloneFunc(); err != nil {
 			return err
 		}
@@ -147,15 +146,12 @@ func runClone(args []string) error {
 		return err
 	}
 
-	if file, err := os.Open(st.reposFile); err == nil {
-		base := filepath.Base(cwd)
-		if instructions, err := parser.ParseList(file, parser.Options{
-			InitialFallbackRemote: base,
-			InitialBaseDir:        base,
-		}); err == nil {
-			updateGitignore(cwd, instructions)
-		}
-		file.Close()
+	base := filepath.Base(cwd)
+	if instructions, err := parser.ParseList(strings.NewReader(strings.Join(lines, "\n")), parser.Options{
+		InitialFallbackRemote: base,
+		InitialBaseDir:        base,
+	}); err == nil {
+		updateGitignore(cwd, instructions)
 	}
 
 	fmt.Println()
@@ -189,16 +185,9 @@ func isLocalRepoSpecForAuthCheck(repoSpec string) bool {
 	}
 }
 
-func hasNonLocalRemotesInFile(reposFile string) (bool, error) {
-	f, err := os.Open(reposFile)
-	if err != nil {
-		return false, err
-	}
-	defer f.Close()
-
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		line := trimLine(sc.Text())
+func hasNonLocalRemotes(lines []string) bool {
+	for _, raw := range lines {
+		line := trimLine(raw)
 		if line == "" || lineIsGlobalFlagsOnly(line) {
 			continue
 		}
@@ -211,7 +200,7 @@ func hasNonLocalRemotesInFile(reposFile string) (bool, error) {
 			continue
 		}
 		if strings.HasPrefix(first, "git@github.com:") || strings.HasPrefix(first, "ssh://git@github.com/") {
-			return true, nil
+			return true
 		}
 		repoSpec, _ := splitRepoSpec(first)
 		if strings.HasPrefix(strings.ToLower(strings.TrimSpace(repoSpec)), "hf:") {
@@ -226,13 +215,10 @@ func hasNonLocalRemotesInFile(reposFile string) (bool, error) {
 			strings.HasPrefix(normalized, "https://github.com/") ||
 			strings.HasPrefix(normalized, "http://github.com/") ||
 			ownerRepoRegex.MatchString(repoSpec) {
-			return true, nil
+			return true
 		}
 	}
-	if err := sc.Err(); err != nil {
-		return false, err
-	}
-	return false, nil
+	return false
 }
 
 // checkNonInteractiveAuthForClone verifies that at least one non-interactive
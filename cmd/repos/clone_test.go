@@ -120,15 +120,11 @@ func TestRunCloneWorktreeAndFallbackTracking(t *testing.T) {
 	}
 }
 
-func TestHasNonLocalRemotesInFile(t *testing.T) {
-	tmp := t.TempDir()
-	list := filepath.Join(tmp, "repos.list")
-
+func TestHasNonLocalRemotes(t *testing.T) {
 	tests := []struct {
-		name    string
-		lines   []string
-		want    bool
-		wantErr bool
+		name  string
+		lines []string
+		want  bool
 	}{
 		{
 			name: "all-local-and-at-branch",
@@ -180,20 +176,7 @@ func TestHasNonLocalRemotesInFile(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			if err := os.WriteFile(list, []byte(strings.Join(tt.lines, "\n")+"\n"), 0o644); err != nil {
-				t.Fatalf("write repos.list: %v", err)
-			}
-			got, err := hasNonLocalRemotesInFile(list)
-			if tt.wantErr {
-				if err == nil {
-					t.Fatalf("expected error")
-				}
-				return
-			}
-			if err != nil {
-				t.Fatalf("hasNonLocalRemotesInFile error: %v", err)
-			}
-			if got != tt.want {
+			if got := hasNonLocalRemotes(tt.lines); got != tt.want {
 				t.Fatalf("expected %v, got %v", tt.want, got)
 			}
 		})
@@ -212,14 +195,14 @@ func TestRunCloneSkipsAuthCheckWhenOnlyLocalRemotes(t *testing.T) {
 	mustInitWorkspaceRepo(t, projectDir, localRemote)
 	mustWriteFile(t, filepath.Join(projectDir, "repos.list"), localRemote+"\n")
 
-	oldHasNonLocal := hasNonLocalRemotesInFileFunc
+	oldHasNonLocal := hasNonLocalRemotesFunc
 	oldAuthCheck := checkNonInteractiveAuthForCloneFunc
 	defer func() {
-		hasNonLocalRemotesInFileFunc = oldHasNonLocal
+		hasNonLocalRemotesFunc = oldHasNonLocal
 		checkNonInteractiveAuthForCloneFunc = oldAuthCheck
 	}()
 
-	hasNonLocalRemotesInFileFunc = func(reposFile string) (bool, error) { return false, nil }
+	hasNonLocalRemotesFunc = func(lines []string) bool { return false }
 	authCheckCalled := false
 	checkNonInteractiveAuthForCloneFunc = func() error {
 		authCheckCalled = true
@@ -253,14 +236,14 @@ func TestRunCloneFailsWhenAuthCheckFailsForNonLocalRemotes(t *testing.T) {
 	mustMkdir(t, projectDir)
 	mustWriteFile(t, filepath.Join(projectDir, "repos.list"), "acme/repo\n")
 
-	oldHasNonLocal := hasNonLocalRemotesInFileFunc
+	oldHasNonLocal := hasNonLocalRemotesFunc
 	oldAuthCheck := checkNonInteractiveAuthForCloneFunc
 	defer func() {
-		hasNonLocalRemotesInFileFunc = oldHasNonLocal
+		hasNonLocalRemotesFunc = oldHasNonLocal
 		checkNonInteractiveAuthForCloneFunc = oldAuthCheck
 	}()
 
-	hasNonLocalRemotesInFileFunc = func(reposFile string) (bool, error) { return true, nil }
+	hasNonLocalRemotesFunc = func(lines []string) bool { return true }
 	checkNonInteractiveAuthForCloneFunc = func() error { return errors.New("auth missing") }
 
 	oldWD, err := os.Getwd()
@@ -627,10 +610,10 @@ func TestRunCloneHuggingFaceSkipsAuthCheck(t *testing.T) {
 	logFile := filepath.Join(tmp, "hf.log")
 	mustWriteHuggingFaceShim(t, binDir, logFile, true)
 
-	oldHasNonLocal := hasNonLocalRemotesInFileFunc
+	oldHasNonLocal := hasNonLocalRemotesFunc
 	oldAuthCheck := checkNonInteractiveAuthForCloneFunc
 	defer func() {
-		hasNonLocalRemotesInFileFunc = oldHasNonLocal
+		hasNonLocalRemotesFunc = oldHasNonLocal
 		checkNonInteractiveAuthForCloneFunc = oldAuthCheck
 	}()
 
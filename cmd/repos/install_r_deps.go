@@ -143,11 +143,10 @@ func runInstallRDeps(args []string) error {
 }
 
 func (s *state) collectManagedRepoPaths() ([]managedRepo, error) {
-	f, err := os.Open(s.reposFile)
+	lines, err := s.listLines()
 	if err != nil {
 		return nil, err
 	}
-	defer f.Close()
 
 	fallbackHTTPS := s.currentRepoHTTPS
 	fallbackLocal := s.startDir
@@ -169,9 +168,8 @@ func (s *state) collectManagedRepoPaths() ([]managedRepo, error) {
 		seenPaths[path] = true
 	}
 
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		trimmed := trimLine(sc.Text())
+	for _, raw := range lines {
+		trimmed := trimLine(raw)
 		if trimmed == "" || lineIsGlobalFlagsOnly(trimmed) {
 			continue
 		}
@@ -251,9 +249,6 @@ func (s *state) collectManagedRepoPaths() ([]managedRepo, error) {
 		seenRemoteLocal[remoteHTTPS] = dest
 	}
 
-	if err := sc.Err(); err != nil {
-		return nil, err
-	}
 	return repos, nil
 }
 
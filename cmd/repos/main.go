@@ -48,6 +48,8 @@ type state struct {
 	seenRemoteLocal       map[string]string
 	plan                  map[string]planInfo
 	counts                counters
+	// reposLines caches the raw lines of reposFile; see listLines.
+	reposLines []string
 }
 
 type planInfo struct {
@@ -322,15 +324,36 @@ func parseDepthToken(tokens []string, i int) (depth int, next int, ok bool, err
 	return 0, i, false, nil
 }
 
-func (s *state) applyGlobalFlagsFromFile() error {
+// listLines returns the raw lines of s.reposFile. The file is read once per
+// state, so the global-flag, planning and execution passes share one read.
+func (s *state) listLines() ([]string, error) {
+	if s.reposLines != nil {
+		return s.reposLines, nil
+	}
 	f, err := os.Open(s.reposFile)
 	if err != nil {
-		return err
+		return nil, err
 	}
 	defer f.Close()
+	lines := make([]string, 0, 32)
 	sc := bufio.NewScanner(f)
 	for sc.Scan() {
-		line := trimLine(sc.Text())
+		lines = append(lines, sc.Text())
+	}
+	if err := sc.Err(); err != nil {
+		return nil, err
+	}
+	s.reposLines = lines
+	return lines, nil
+}
+
+func (s *state) applyGlobalFlagsFromFile() error {
+	lines, err := s.listLines()
+	if err != nil {
+		return err
+	}
+	for _, raw := range lines {
+		line := trimLine(raw)
 		if line == "" {
 			continue
 		}
@@ -384,7 +407,7 @@ func (s *state) applyGlobalFlagsFromFile() error {
 			}
 		}
 	}
-	return sc.Err()
+	return nil
 }
 
 func validateBranch(branch string) error {
@@ -581,16 +604,14 @@ func (s *state) parseEffectiveLine(trimmed string, fallbackHTTPS string) (instru
 }
 
 func (s *state) planForward() error {
-	f, err := os.Open(s.reposFile)
+	lines, err := s.listLines()
 	if err != nil {
 		return err
 	}
-	defer f.Close()
 
 	fallback := s.currentRepoHTTPS
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		trimmed := trimLine(sc.Text())
+	for _, raw := range lines {
+		trimmed := trimLine(raw)
 		if trimmed == "" || lineIsGlobalFlagsOnly(trimmed) {
 			continue
 		}
@@ -631,7 +652,7 @@ func (s *state) planForward() error {
 		s.plan[remote] = pi
 		fallback = remote
 	}
-	return sc.Err()
+	return nil
 }
 
 func parseRepoURL(repoURLNoRef string) (repoURL, repoDir string, err error) {
@@ -1082,14 +1103,12 @@ func (s *state) createWorktreeForBranch(base, branch, targetDir, fetchMode strin
 }
 
 func (s *state) processFile() error {
-	f, err := os.Open(s.reposFile)
+	lines, err := s.listLines()
 	if err != nil {
 		return err
 	}
-	defer f.Close()
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		trimmed := trimLine(sc.Text())
+	for _, raw := range lines {
+		trimmed := trimLine(raw)
 		if trimmed == "" || lineIsGlobalFlagsOnly(trimmed) {
 			continue
 		}
@@ -1193,5 +1212,5 @@ func (s *state) processFile() error {
 			}
 		}
 	}
-	return sc.Err()
+	return nil
 }
@@ -1,6 +1,10 @@
 package main
 
-import "testing"
+import (
+	"os"
+	"path/filepath"
+	"testing"
+)
 
 func TestParseRepoURLSupportsWindowsBackslashPathForms(t *testing.T) {
 	tests := []struct {
@@ -27,3 +31,30 @@ func TestParseRepoURLSupportsWindowsBackslashPathForms(t *testing.T) {
 		})
 	}
 }
+
+func TestStateListLinesReadsFileOnce(t *testing.T) {
+	listPath := filepath.Join(t.TempDir(), "repos.list")
+	if err := os.WriteFile(listPath, []byte("# comment\nexample/repo-one\n"), 0o644); err != nil {
+		t.Fatalf("write list: %v", err)
+	}
+
+	st := &state{reposFile: listPath}
+	first, err := st.listLines()
+	if err != nil {
+		t.Fatalf("listLines returned error: %v", err)
+	}
+	if len(first) != 2 || first[1] != "example/repo-one" {
+		t.Fatalf("unexpected lines: %q", first)
+	}
+
+	if err := os.Remove(listPath); err != nil {
+		t.Fatalf("remove list: %v", err)
+	}
+	second, err := st.listLines()
+	if err != nil {
+		t.Fatalf("expected cached lines after file removal, got error: %v", err)
+	}
+	if len(second) != len(first) {
+		t.Fatalf("expected cached lines %q, got %q", first, second)
+	}
+}
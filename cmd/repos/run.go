@@ -32,6 +32,8 @@ type runResult struct {
 type runOptions struct {
 	reposFile  string
 	concurrent bool
+	// jobs caps concurrent workers; 0 (flag not given) means no cap.
+	jobs int
 	// script defaults to run.sh for pipeline mode.
 	script          string
 	include         map[string]struct{}
@@ -61,6 +63,9 @@ const (
 	maxScannerBufferSize     = 1024 * 1024
 )
 
+var runTargetsConcurrentlyFunc = runTargetsConcurrently
+var runCommandInTargetFunc = runCommandInTarget
+
 var scriptPathCharPattern = regexp.MustCompile(`^[a-zA-Z0-9._/-]+$`)
 var conciseRepoNamePattern = regexp.MustCompile(`^[a-zA-Z0-9._-]+$`)
 
@@ -158,19 +163,13 @@ func runExplicitCommandMode(st *state, opts runOptions) error {
 	}
 
 	var outMu sync.Mutex
-	results := make([]runResult, len(targets))
+	var results []runResult
 
-	if opts.concurrent {
-		var wg sync.WaitGroup
-		for i, target := range targets {
-			wg.Add(1)
-			go func(idx int, t runTarget) {
-				defer wg.Done()
-				results[idx] = runCommandInTarget(t, opts.explicitCommand, &outMu)
-			}(i, target)
-		}
-		wg.Wait()
+	// A single target gains nothing from the worker pool, so run it inline.
+	if opts.concurrent && len(targets) > 1 {
+		results = runTargetsConcurrentlyFunc(targets, opts, &outMu)
 	} else {
+		results = make([]runResult, len(targets))
 		for i, target := range targets {
 			results[i] = runCommandInTarget(target, opts.explicitCommand, &outMu)
 		}
@@ -188,6 +187,29 @@ func runExplicitCommandMode(st *state, opts runOptions) error {
 	return nil
 }
 
+// runTargetsConcurrently runs the explicit command in every target using at
+// most opts.jobs workers, or one worker per target when --jobs is not given.
+func runTargetsConcurrently(targets []runTarget, opts runOptions, outMu *sync.Mutex) []runResult {
+	jobs := opts.jobs
+	if jobs == 0 {
+		jobs = len(targets)
+	}
+	results := make([]runResult, len(targets))
+	sem := make(chan struct{}, jobs)
+	var wg sync.WaitGroup
+	for i, target := range targets {
+		wg.Add(1)
+		go func(idx int, t runTarget) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			results[idx] = runCommandInTargetFunc(t, opts.explicitCommand, outMu)
+		}(i, target)
+	}
+	wg.Wait()
+	return results
+}
+
 func parseRunOptions(args []string, defaultFile string) (runOptions, error) {
 	fs := flag.NewFlagSet("run", flag.ContinueOnError)
 	fs.SetOutput(os.Stderr)
@@ -204,6 +226,8 @@ func parseRunOptions(args []string, defaultFile string) (runOptions, error) {
 	fs.StringVar(&opts.reposFile, "file", defaultFile, "repos list file")
 	fs.StringVar(&opts.reposFile, "f", defaultFile, "repos list file")
 	fs.BoolVar(&opts.concurrent, "concurrent", false, "run command across repos concurrently")
+	fs.IntVar(&opts.jobs, "jobs", 0, "maximum number of concurrent workers")
+	fs.IntVar(&opts.jobs, "j", 0, "maximum number of concurrent workers")
 	fs.StringVar(&opts.script, "script", "run.sh", "script to run in each repository")
 	fs.StringVar(&includeRaw, "include", "", "comma-separated list of repositories to include")
 	fs.StringVar(&includeRaw, "i", "", "comma-separated list of repositories to include")
@@ -231,6 +255,21 @@ func parseRunOptions(args []string, defaultFile string) (runOptions, error) {
 	opts.include = parseCSVSet(includeRaw)
 	opts.exclude = parseCSVSet(excludeRaw)
 	opts.explicitCommand = fs.Args()
+
+	jobsSet := false
+	fs.Visit(func(f *flag.Flag) {
+		if f.Name == "jobs" || f.Name == "j" {
+			jobsSet = true
+		}
+	})
+	if jobsSet {
+		if opts.jobs < 1 {
+			return runOptions{}, fmt.Errorf("--jobs must be a positive integer; got: %d", opts.jobs)
+		}
+		if !opts.concurrent || len(opts.explicitCommand) == 0 {
+			return runOptions{}, errors.New("--jobs requires --concurrent and an explicit command")
+		}
+	}
 	return opts, nil
 }
 
@@ -267,11 +306,11 @@ func isAbsoluteScriptPath(script string) bool {
 }
 
 func (s *state) collectPipelineTargets(opts runOptions) ([]pipelineTarget, error) {
-	concise, err := isConciseRunList(s.reposFile)
+	lines, err := s.listLines()
 	if err != nil {
 		return nil, err
 	}
-	if concise {
+	if isConciseRunList(lines) {
 		return s.collectConciseRunTargets(opts)
 	}
 
@@ -295,40 +334,29 @@ func (s *state) collectPipelineTargets(opts runOptions) ([]pipelineTarget, error
 	return pipelineTargets, nil
 }
 
-func isConciseRunList(path string) (bool, error) {
-	f, err := os.Open(path)
-	if err != nil {
-		return false, err
-	}
-	defer f.Close()
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		line := trimLine(sc.Text())
+func isConciseRunList(lines []string) bool {
+	for _, raw := range lines {
+		line := trimLine(raw)
 		if line == "" || lineIsGlobalFlagsOnly(line) {
 			continue
 		}
 		switch {
 		case strings.HasPrefix(line, "@"), strings.Contains(line, "/"):
-			return false, nil
+			return false
 		}
 	}
-	if err := sc.Err(); err != nil {
-		return false, err
-	}
-	return true, nil
+	return true
 }
 
 func (s *state) collectConciseRunTargets(opts runOptions) ([]pipelineTarget, error) {
-	f, err := os.Open(s.reposFile)
+	lines, err := s.listLines()
 	if err != nil {
 		return nil, err
 	}
-	defer f.Close()
 
 	var targets []pipelineTarget
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		line := trimLine(sc.Text())
+	for _, raw := range lines {
+		line := trimLine(raw)
 		if line == "" || lineIsGlobalFlagsOnly(line) {
 			continue
 		}
@@ -368,9 +396,6 @@ func (s *state) collectConciseRunTargets(opts runOptions) ([]pipelineTarget, err
 			script: script,
 		})
 	}
-	if err := sc.Err(); err != nil {
-		return nil, err
-	}
 	return targets, nil
 }
 
@@ -469,7 +494,9 @@ func runScriptInTarget(t pipelineTarget, opts runOptions) runScriptResult {
 	}
 	// Security: Use Lstat to ensure we don't follow symlinks when calling Chmod.
 	// os.Chmod follows symlinks on many platforms, which could lead to privilege escalation.
-	if info, err := os.Lstat(scriptPath); err == nil && info.Mode().IsRegular() {
+	// Scripts that are already owner-executable are left alone to avoid a
+	// redundant chmod per repository on every run.
+	if info, err := os.Lstat(scriptPath); err == nil && info.Mode().IsRegular() && info.Mode().Perm()&0o100 == 0 {
 		if err := os.Chmod(scriptPath, 0o755); err != nil {
 			printPrefixedLine(t.target.name, "Warning: could not chmod "+t.script+": "+err.Error(), nil)
 		}
@@ -485,10 +512,26 @@ func runScriptInTarget(t pipelineTarget, opts runOptions) runScriptResult {
 	return runScriptResult{}
 }
 
+var (
+	windowsShPath string
+	windowsShOnce sync.Once
+)
+
+// lookupWindowsSh resolves sh once per process so that pipeline runs over
+// many repositories do not repeat the PATH search for every script.
+func lookupWindowsSh() string {
+	windowsShOnce.Do(func() {
+		if path, err := exec.LookPath("sh"); err == nil {
+			windowsShPath = path
+		}
+	})
+	return windowsShPath
+}
+
 func commandForScript(script string) *exec.Cmd {
 	if runtime.GOOS == "windows" {
-		if _, err := exec.LookPath("sh"); err == nil {
-			return exec.Command("sh", filepath.ToSlash(script))
+		if sh := lookupWindowsSh(); sh != "" {
+			return exec.Command(sh, filepath.ToSlash(script))
 		}
 	}
 	return exec.Command("./" + script)
@@ -551,19 +594,17 @@ func printRunPipelineSummary(stats runPipelineStats) {
 }
 
 func (s *state) collectRunTargets() ([]runTarget, error) {
-	f, err := os.Open(s.reposFile)
+	lines, err := s.listLines()
 	if err != nil {
 		return nil, err
 	}
-	defer f.Close()
 
 	var targets []runTarget
 	fallbackHTTPS := s.currentRepoHTTPS
 	fallbackLocalName := filepath.Base(s.startDir)
-	sc := bufio.NewScanner(f)
 
-	for sc.Scan() {
-		trimmed := trimLine(sc.Text())
+	for _, raw := range lines {
+		trimmed := trimLine(raw)
 		if trimmed == "" || lineIsGlobalFlagsOnly(trimmed) {
 			continue
 		}
@@ -632,9 +673,6 @@ func (s *state) collectRunTargets() ([]runTarget, error) {
 		s.seenRemoteLocal[remoteHTTPS] = destPath
 	}
 
-	if err := sc.Err(); err != nil {
-		return nil, err
-	}
 	return targets, nil
 }
 
@@ -805,6 +843,8 @@ Options:
       --verbose            Enable verbose logging
       --continue-on-error  Continue after script failures
       --concurrent         Run explicit command mode in parallel
+  -j, --jobs <n>           Maximum parallel workers for --concurrent; requires
+                           an explicit command (default: no limit)
   -h, --help               Show this help message.
 
 Examples:
@@ -812,6 +852,7 @@ Examples:
   repos run --script pipeline.sh --continue-on-error
   repos run make test
   repos run --concurrent npm install
+  repos run --concurrent --jobs 4 git fetch
 `)
 }
 
@@ -5,8 +5,12 @@ import (
 	"io"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"testing"
+	"time"
 )
 
 func TestRunExecutesCommandInAllRepos(t *testing.T) {
@@ -127,6 +131,131 @@ func TestRunConcurrentExecutesCommandInAllRepos(t *testing.T) {
 	assertFileExists(t, filepath.Join(repo2, ".ran.concurrent"))
 }
 
+func TestRunConcurrentHonorsJobsLimit(t *testing.T) {
+	tmp := t.TempDir()
+	projectDir := filepath.Join(tmp, "project")
+	repos := []string{"repo-one", "repo-two", "repo-three", "repo-four"}
+	var list strings.Builder
+	for _, name := range repos {
+		mustMkdirAll(t, filepath.Join(projectDir, name))
+		list.WriteString("example/" + name + "\n")
+	}
+	mustWriteFile(t, filepath.Join(projectDir, "repos.list"), list.String())
+
+	oldWD, err := os.Getwd()
+	if err != nil {
+		t.Fatalf("getwd: %v", err)
+	}
+	oldRunCommand := runCommandInTargetFunc
+	t.Cleanup(func() {
+		_ = os.Chdir(oldWD)
+		runCommandInTargetFunc = oldRunCommand
+	})
+	if err := os.Chdir(projectDir); err != nil {
+		t.Fatalf("chdir project dir: %v", err)
+	}
+
+	var running, peak int32
+	runCommandInTargetFunc = func(target runTarget, command []string, outMu *sync.Mutex) runResult {
+		n := atomic.AddInt32(&running, 1)
+		for {
+			p := atomic.LoadInt32(&peak)
+			if n <= p || atomic.CompareAndSwapInt32(&peak, p, n) {
+				break
+			}
+		}
+		time.Sleep(50 * time.Millisecond)
+		atomic.AddInt32(&running, -1)
+		return runResult{target: target}
+	}
+
+	tests := []struct {
+		args    []string
+		wantMax int32
+		wantMin int32
+	}{
+		{args: []string{"--concurrent", "--jobs", "1", "true"}, wantMin: 1, wantMax: 1},
+		{args: []string{"--concurrent", "--jobs", "2", "true"}, wantMin: 2, wantMax: 2},
+		{args: []string{"--concurrent", "true"}, wantMin: 2, wantMax: int32(len(repos))},
+	}
+	for _, tt := range tests {
+		atomic.StoreInt32(&peak, 0)
+		if err := runRun(tt.args); err != nil {
+			t.Fatalf("runRun(%q) returned error: %v", tt.args, err)
+		}
+		if got := atomic.LoadInt32(&peak); got < tt.wantMin || got > tt.wantMax {
+			t.Fatalf("runRun(%q): expected peak concurrency in [%d, %d], got %d", tt.args, tt.wantMin, tt.wantMax, got)
+		}
+	}
+}
+
+func TestRunConcurrentRunsSingleRepoInline(t *testing.T) {
+	tmp := t.TempDir()
+	projectDir := filepath.Join(tmp, "project")
+	repo1 := filepath.Join(projectDir, "repo-one")
+	repo2 := filepath.Join(projectDir, "repo-two")
+
+	mustMkdirAll(t, projectDir, repo1, repo2)
+
+	oldWD, err := os.Getwd()
+	if err != nil {
+		t.Fatalf("getwd: %v", err)
+	}
+	oldConcurrent := runTargetsConcurrentlyFunc
+	t.Cleanup(func() {
+		_ = os.Chdir(oldWD)
+		runTargetsConcurrentlyFunc = oldConcurrent
+	})
+	if err := os.Chdir(projectDir); err != nil {
+		t.Fatalf("chdir project dir: %v", err)
+	}
+
+	poolCalls := 0
+	runTargetsConcurrentlyFunc = func(targets []runTarget, opts runOptions, outMu *sync.Mutex) []runResult {
+		poolCalls++
+		return oldConcurrent(targets, opts, outMu)
+	}
+
+	mustWriteFile(t, filepath.Join(projectDir, "repos.list"), "example/repo-one\n")
+	if err := runRun([]string{"--concurrent", "sh", "-c", "echo ran > .ran.single"}); err != nil {
+		t.Fatalf("runRun returned error: %v", err)
+	}
+	assertFileExists(t, filepath.Join(repo1, ".ran.single"))
+	if poolCalls != 0 {
+		t.Fatalf("expected single target to bypass the worker pool, got %d pool calls", poolCalls)
+	}
+
+	mustWriteFile(t, filepath.Join(projectDir, "repos.list"), "example/repo-one\nexample/repo-two\n")
+	if err := runRun([]string{"--concurrent", "sh", "-c", "echo ran > .ran.multi"}); err != nil {
+		t.Fatalf("runRun returned error: %v", err)
+	}
+	assertFileExists(t, filepath.Join(repo2, ".ran.multi"))
+	if poolCalls != 1 {
+		t.Fatalf("expected multiple targets to use the worker pool once, got %d pool calls", poolCalls)
+	}
+}
+
+func TestParseRunOptionsJobs(t *testing.T) {
+	opts, err := parseRunOptions([]string{"-j", "3", "--concurrent", "true"}, "repos.list")
+	if err != nil {
+		t.Fatalf("parseRunOptions returned error: %v", err)
+	}
+	if opts.jobs != 3 {
+		t.Fatalf("expected jobs=3, got %d", opts.jobs)
+	}
+	bad := [][]string{
+		{"--concurrent", "--jobs", "-1", "true"},
+		{"--concurrent", "--jobs", "0", "true"},
+		{"--jobs", "2", "true"},
+		{"--concurrent", "--jobs", "2"},
+	}
+	for _, args := range bad {
+		if _, err := parseRunOptions(args, "repos.list"); err == nil {
+			t.Fatalf("expected parseRunOptions(%q) to fail", args)
+		}
+	}
+}
+
 func TestRunPipelineModeExecutesDefaultScript(t *testing.T) {
 	tmp := t.TempDir()
 	projectDir := filepath.Join(tmp, "project")
@@ -157,6 +286,47 @@ func TestRunPipelineModeExecutesDefaultScript(t *testing.T) {
 	assertFileExists(t, filepath.Join(repo2, ".pipeline"))
 }
 
+func TestRunPipelineModeKeepsExecutableScriptMode(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("POSIX permission bits are not meaningful on Windows")
+	}
+	tmp := t.TempDir()
+	projectDir := filepath.Join(tmp, "project")
+	repo1 := filepath.Join(projectDir, "repo-one")
+
+	mustMkdirAll(t, projectDir, repo1)
+	mustWriteFile(t, filepath.Join(projectDir, "repos.list"), "example/repo-one\n")
+	scriptPath := filepath.Join(repo1, "run.sh")
+	mustWriteFile(t, scriptPath, "#!/usr/bin/env sh\ntouch .pipeline\n")
+	if err := os.Chmod(scriptPath, 0o700); err != nil {
+		t.Fatalf("chmod script: %v", err)
+	}
+
+	oldWD, err := os.Getwd()
+	if err != nil {
+		t.Fatalf("getwd: %v", err)
+	}
+	t.Cleanup(func() {
+		_ = os.Chdir(oldWD)
+	})
+	if err := os.Chdir(projectDir); err != nil {
+		t.Fatalf("chdir project dir: %v", err)
+	}
+
+	if err := runRun([]string{"--skip-deps"}); err != nil {
+		t.Fatalf("runRun returned error: %v", err)
+	}
+
+	assertFileExists(t, filepath.Join(repo1, ".pipeline"))
+	info, err := os.Stat(scriptPath)
+	if err != nil {
+		t.Fatalf("stat script: %v", err)
+	}
+	if got := info.Mode().Perm(); got != 0o700 {
+		t.Fatalf("expected executable script mode to be left at 0700, got %o", got)
+	}
+}
+
 func TestRunPipelineModeHonorsIncludeFilter(t *testing.T) {
 	tmp := t.TempDir()
 	projectDir := filepath.Join(tmp, "project")
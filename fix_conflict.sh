@@ -1,3 +0,0 @@
-sed -i 's/<<<<<<< Updated upstream//' tests/test-python-wrappers.py
-sed -i 's/=======//' tests/test-python-wrappers.py
-sed -i 's/>>>>>>> Stashed changes//' tests/test-python-wrappers.py
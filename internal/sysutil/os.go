@@ -1,9 +1,7 @@
 package sysutil
 
 import (
-	"bufio"
 	"fmt"
-	"os"
 	"os/exec"
 	"strings"
 )
@@ -17,15 +15,13 @@ func CheckPrerequisites() error {
 	return nil
 }
 
-func CheckClonePrerequisites(reposFile string) error {
+// CheckClonePrerequisites checks the tools needed to clone the repos.list
+// given as raw lines.
+func CheckClonePrerequisites(lines []string) error {
 	if err := CheckPrerequisites(); err != nil {
 		return err
 	}
-	needsHFCLI, err := clonePlanRequiresHuggingFaceCLI(reposFile)
-	if err != nil {
-		return err
-	}
-	if needsHFCLI {
+	if clonePlanRequiresHuggingFaceCLI(lines) {
 		if _, err := exec.LookPath("huggingface-cli"); err != nil {
 			return fmt.Errorf("error: 'huggingface-cli' is required for hf: repositories but was not found in PATH (install with: pip install huggingface_hub[cli])")
 		}
@@ -33,37 +29,27 @@ func CheckClonePrerequisites(reposFile string) error {
 	return nil
 }
 
-func clonePlanRequiresHuggingFaceCLI(reposFile string) (bool, error) {
-	f, err := os.Open(reposFile)
-	if err != nil {
-		return false, err
-	}
-	defer f.Close()
-
+func clonePlanRequiresHuggingFaceCLI(lines []string) bool {
 	fallbackIsHuggingFace := false
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		line := trimClonePrereqLine(sc.Text())
+	for _, raw := range lines {
+		line := trimClonePrereqLine(raw)
 		if line == "" || lineIsGlobalFlagsOnly(line) {
 			continue
 		}
 		first := strings.Fields(line)[0]
 		if strings.HasPrefix(first, "@") {
 			if fallbackIsHuggingFace {
-				return true, nil
+				return true
 			}
 			continue
 		}
 		repoNoRef := repoSpecWithoutRef(first)
 		fallbackIsHuggingFace = isHuggingFaceSpec(repoNoRef)
 		if fallbackIsHuggingFace {
-			return true, nil
+			return true
 		}
 	}
-	if err := sc.Err(); err != nil {
-		return false, err
-	}
-	return false, nil
+	return false
 }
 
 func trimClonePrereqLine(line string) string {
@@ -4,11 +4,11 @@ repos - Multi-Repository Management Tool
 A Python wrapper for the repos Go CLI that manages multiple related Git repositories.
 """
 
+import functools
 import os
 import sys
-import subprocess
 import warnings
-from typing import Optional, List, Union
+from typing import Iterable, Optional, List, Union
 
 __version__ = "2.0.0"
 
@@ -56,11 +56,13 @@ def installed_cli_version() -> Optional[str]:
         >>> print(ver)   # e.g. "1.1.0" or None
     """
     import shutil
-    if shutil.which("repos") is None:
+    cli = shutil.which("repos")
+    if cli is None:
         return None
+    import subprocess
     try:
         result = subprocess.run(
-            ["repos", "--version"],
+            [cli, "--version"],
             capture_output=True,
             text=True,
             check=False,
@@ -96,6 +98,7 @@ def install_cli(run: bool = False) -> None:
         >>> install_cli(run=True)
     """
     import platform
+    import subprocess
     system = platform.system()
 
     if system == "Linux":
@@ -157,14 +160,61 @@ def install_cli(run: bool = False) -> None:
         print("  https://miguelrodo.github.io/repos/install.html\n")
 
 
+@functools.lru_cache(maxsize=1)
+def _find_cli(path_env: Optional[str]) -> Optional[str]:
+    """
+    Return the resolved path of the repos CLI on *path_env*, or None.
+
+    Keyed on the ``PATH`` value so the lookup is repeated only when ``PATH``
+    changes.  Used only to launch the CLI; ``installed_cli_version()``
+    always searches ``PATH`` afresh.
+    """
+    import shutil
+    return shutil.which("repos", path=path_env)
+
+
+def _cli_path() -> str:
+    """
+    Return the repos CLI to execute.
+
+    Falls back to the bare name ``"repos"`` when it is not on ``PATH`` so
+    that the subprocess call reports the usual "not found" error.
+    """
+    return _find_cli(os.environ.get("PATH")) or "repos"
+
+
 def run_repos_command(command: str, args=None):
     """
     Run the installed repos CLI with a subcommand and arguments.
     """
-    cmd = ["repos", command]
+    # Imported lazily so `import repos` stays cheap for callers that only
+    # query versions or print install instructions.
+    import subprocess
+    cli = _cli_path()
+    cmd = [cli, command]
     if args:
         cmd.extend(args)
-    return subprocess.run(cmd, check=True, text=True)
+    try:
+        return subprocess.run(cmd, check=True, text=True)
+    except FileNotFoundError:
+        if cli == "repos":
+            raise
+        # The cached binary was removed or moved; search PATH again.
+        _find_cli.cache_clear()
+        cmd[0] = "repos"
+        return subprocess.run(cmd, check=True, text=True)
+
+
+def _debug_args(debug: bool, debug_file: Optional[Union[bool, str]]) -> List[str]:
+    """
+    Build the ``--debug``/``--debug-file`` arguments shared by several subcommands.
+    """
+    args = ["--debug"] if debug else []
+    if debug_file is True:
+        args.append("--debug-file")
+    elif debug_file is not None:
+        args.extend(["--debug-file", debug_file])
+    return args
 
 
 def workspace(
@@ -197,14 +247,7 @@ def workspace(
     if file is not None:
         script_args.extend(["-f", file])
 
-    if debug:
-        script_args.append("--debug")
-
-    if debug_file is not None:
-        if debug_file is True:
-            script_args.append("--debug-file")
-        else:
-            script_args.extend(["--debug-file", debug_file])
+    script_args.extend(_debug_args(debug, debug_file))
 
     return run_repos_command("workspace", script_args)
 
@@ -284,14 +327,7 @@ def codespace(
             stacklevel=2,
         )
 
-    if debug:
-        script_args.append("--debug")
-
-    if debug_file is not None:
-        if debug_file is True:
-            script_args.append("--debug-file")
-        else:
-            script_args.extend(["--debug-file", debug_file])
+    script_args.extend(_debug_args(debug, debug_file))
 
     return run_repos_command("codespace", script_args)
 
@@ -315,8 +351,8 @@ def codespace_raw(*args):
 def run(
     file: Optional[str] = None,
     script: Optional[str] = None,
-    include: Optional[Union[str, List[str]]] = None,
-    exclude: Optional[Union[str, List[str]]] = None,
+    include: Optional[Union[str, Iterable[str]]] = None,
+    exclude: Optional[Union[str, Iterable[str]]] = None,
     ensure_setup: bool = False,
     skip_deps: bool = False,
     dry_run: bool = False,
@@ -330,8 +366,8 @@ def run(
     Args:
         file: Path to repos list file (default: repos.list)
         script: Script to run in each repo, relative to repo root (default: run.sh)
-        include: Repo name(s) to include (string or list of strings)
-        exclude: Repo name(s) to exclude (string or list of strings)
+        include: Repo name(s) to include (string, or list/tuple of strings)
+        exclude: Repo name(s) to exclude (string, or list/tuple of strings)
         ensure_setup: If True, clone repositories before executing scripts
         skip_deps: If True, skip the install-r-deps step
         dry_run: If True, show what would be done without executing
@@ -378,11 +414,11 @@ def run(
         script_args.extend(["--script", script])
     
     if include is not None:
-        include_str = ",".join(include) if isinstance(include, list) else include
+        include_str = include if isinstance(include, str) else ",".join(include)
         script_args.extend(["-i", include_str])
     
     if exclude is not None:
-        exclude_str = ",".join(exclude) if isinstance(exclude, list) else exclude
+        exclude_str = exclude if isinstance(exclude, str) else ",".join(exclude)
         script_args.extend(["-e", exclude_str])
     
     if ensure_setup:
@@ -486,14 +522,7 @@ def clone(
     if file is not None:
         script_args.extend(["-f", file])
 
-    if debug:
-        script_args.append("--debug")
-
-    if debug_file is not None:
-        if debug_file is True:
-            script_args.append("--debug-file")
-        else:
-            script_args.extend(["--debug-file", debug_file])
+    script_args.extend(_debug_args(debug, debug_file))
 
     if fetch_mode is not None:
         _fetch_flag_map = {
@@ -0,0 +1,225 @@
+"""Test Python wrapper functions with idiomatic syntax"""
+
+import shutil
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+# Add src to path to import repos module
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+# Import the module
+import repos
+
+
+class MockResult:
+    returncode = 0
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Replace run_repos_command and record the command and arguments."""
+    box = {}
+
+    def mock_run_repos_command(command, args=None):
+        box["command"] = command
+        box["args"] = args or []
+        return MockResult()
+
+    monkeypatch.setattr(repos, "run_repos_command", mock_run_repos_command)
+    return box
+
+
+@pytest.fixture
+def fresh_cli_cache():
+    repos._find_cli.cache_clear()
+    yield
+    repos._find_cli.cache_clear()
+
+
+# Test version utilities
+def test_bundled_cli_version():
+    version = repos.bundled_cli_version()
+    assert isinstance(version, str), f"Expected string, got {type(version)}"
+    assert version == repos._BUNDLED_CLI_VERSION
+
+
+# Wrapper calls whose full argument vector is known exactly
+@pytest.mark.parametrize(
+    "func, kwargs, command, expected_args",
+    [
+        (repos.workspace, {}, "workspace", []),
+        (repos.codespace, {}, "codespace", []),
+        (repos.run, {}, "run", []),
+        (
+            repos.clone,
+            {"file": "custom.list", "debug": True, "debug_file": "debug.log"},
+            "clone",
+            ["-f", "custom.list", "--debug", "--debug-file", "debug.log"],
+        ),
+    ],
+    ids=[
+        "workspace-no-args",
+        "codespace-no-args",
+        "run-no-args",
+        "clone-debug-and-debug-file",
+    ],
+)
+def test_exact_args(captured, func, kwargs, command, expected_args):
+    func(**kwargs)
+    assert captured["command"] == command
+    assert captured["args"] == expected_args
+
+
+# Wrapper calls that must include the given flags/values
+@pytest.mark.parametrize(
+    "func, kwargs, command, expected_subset",
+    [
+        (repos.workspace, {"file": "custom.list"}, "workspace", ["-f", "custom.list"]),
+        (repos.workspace, {"debug": True}, "workspace", ["--debug"]),
+        (repos.workspace, {"debug_file": True}, "workspace", ["--debug-file"]),
+        (repos.workspace, {"debug_file": "debug.log"}, "workspace", ["--debug-file", "debug.log"]),
+        (repos.codespace, {"file": "custom.list"}, "codespace", ["-f", "custom.list"]),
+        (repos.codespace, {"devcontainer": "path1"}, "codespace", ["-d", "path1"]),
+        (repos.codespace, {"permissions": "all"}, "codespace", ["--permissions", "all"]),
+        (repos.codespace, {"debug": True}, "codespace", ["--debug"]),
+        (repos.clone, {"depth": 1}, "clone", ["--depth", "1"]),
+        (repos.run, {"script": "build.sh"}, "run", ["--script", "build.sh"]),
+        (repos.run, {"dry_run": True, "verbose": True}, "run", ["--dry-run", "--verbose"]),
+        (repos.run, {"include": ["repo1", "repo2"]}, "run", ["-i", "repo1,repo2"]),
+        (repos.run, {"include": "repo1,repo2"}, "run", ["-i", "repo1,repo2"]),
+        (repos.run, {"include": ("repo1", "repo2")}, "run", ["-i", "repo1,repo2"]),
+        (repos.run, {"exclude": "repo3"}, "run", ["-e", "repo3"]),
+        (
+            repos.run,
+            {"ensure_setup": True, "skip_deps": True},
+            "run",
+            ["--ensure-setup", "--skip-deps"],
+        ),
+        (repos.run, {"continue_on_error": True}, "run", ["--continue-on-error"]),
+        (repos.run, {"file": "custom.list"}, "run", ["-f", "custom.list"]),
+    ],
+)
+def test_args_contain(captured, func, kwargs, command, expected_subset):
+    func(**kwargs)
+    assert captured["command"] == command
+    args = captured["args"]
+    # Flags with values must appear adjacent and in order
+    start = args.index(expected_subset[0])
+    assert args[start:start + len(expected_subset)] == expected_subset
+
+
+# Test raw helpers
+@pytest.mark.parametrize(
+    "func, raw_args, command",
+    [
+        (repos.workspace_raw, ("-f", "custom.list"), "workspace"),
+        (repos.codespace_raw, ("-d", ".devcontainer/devcontainer.json"), "codespace"),
+        (repos.run_raw, ("--script", "test.sh", "--dry-run"), "run"),
+        (repos.clone_raw, ("-f", "my-repos.list"), "clone"),
+    ],
+)
+def test_raw_helpers(captured, func, raw_args, command):
+    func(*raw_args)
+    assert captured["command"] == command
+    assert captured["args"] == list(raw_args)
+
+
+def test_codespace_devcontainer_list(captured):
+    repos.codespace(devcontainer=["path1", "path2"])
+    assert captured["command"] == "codespace"
+    dc_indices = [i for i, x in enumerate(captured["args"]) if x == "-d"]
+    assert len(dc_indices) == 2
+    assert captured["args"][dc_indices[0] + 1] == "path1"
+    assert captured["args"][dc_indices[1] + 1] == "path2"
+
+
+def test_codespace_tool(captured):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        repos.codespace(tool="jq")
+    assert captured["command"] == "codespace"
+    assert "-t" not in captured["args"]
+    assert "jq" not in captured["args"]
+    assert any("codespace(tool=...)" in str(w.message) for w in caught)
+    assert any(w.category is DeprecationWarning for w in caught)
+
+
+@pytest.mark.parametrize("depth", [0, True])
+def test_clone_invalid_depth(captured, depth):
+    with pytest.raises(ValueError, match="depth must be a positive integer"):
+        repos.clone(depth=depth)
+
+
+# Test CLI lookup and version helpers
+def test_cli_path_cached(monkeypatch, fresh_cli_cache):
+    calls = []
+
+    def mock_which(name, path=None):
+        calls.append(path)
+        return path + "/repos"
+
+    monkeypatch.setattr(shutil, "which", mock_which)
+    monkeypatch.setenv("PATH", "/opt/bin")
+    assert repos._cli_path() == "/opt/bin/repos"
+    assert repos._cli_path() == "/opt/bin/repos"
+    assert calls == ["/opt/bin"], f"Expected one lookup, got {calls}"
+
+    # A changed PATH triggers a new lookup
+    monkeypatch.setenv("PATH", "/usr/local/bin")
+    assert repos._cli_path() == "/usr/local/bin/repos"
+    assert calls == ["/opt/bin", "/usr/local/bin"]
+
+
+def test_run_repos_command_retries_stale_cli_path(monkeypatch, fresh_cli_cache):
+    monkeypatch.setattr(shutil, "which", lambda name, path=None: "/gone/repos")
+    calls = []
+
+    def mock_subprocess_run(cmd, **kwargs):
+        calls.append(list(cmd))
+        if cmd[0] == "/gone/repos":
+            raise FileNotFoundError(cmd[0])
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(subprocess, "run", mock_subprocess_run)
+    result = repos.run_repos_command("run", ["--dry-run"])
+    assert result.returncode == 0
+    assert calls == [["/gone/repos", "run", "--dry-run"], ["repos", "run", "--dry-run"]]
+
+
+def test_installed_cli_version_not_found(monkeypatch, fresh_cli_cache):
+    monkeypatch.setattr(shutil, "which", lambda x, path=None: None)
+    assert repos.installed_cli_version() is None
+    assert repos._cli_path() == "repos"
+
+
+def test_installed_cli_version_sees_later_install(monkeypatch):
+    # A CLI installed after a "not found" result must be picked up
+    found = {"path": None}
+    monkeypatch.setattr(shutil, "which", lambda x: found["path"])
+
+    def mock_subprocess_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, stdout="v2.0.0\n", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", mock_subprocess_run)
+    assert repos.installed_cli_version() is None
+    found["path"] = "/opt/bin/repos"
+    assert repos.installed_cli_version() == "2.0.0"
+
+
+def test_installed_cli_version_exception(monkeypatch):
+    # Pretend the CLI is installed, then make the subprocess call fail
+    monkeypatch.setattr(
+        shutil, "which", lambda x: "/usr/local/bin/repos" if x == "repos" else None
+    )
+
+    def mock_subprocess_run(*args, **kwargs):
+        raise Exception("Mocked subprocess exception")
+
+    monkeypatch.setattr(subprocess, "run", mock_subprocess_run)
+    result = repos.installed_cli_version()
+    assert result is None, f"Expected None, got {result}"